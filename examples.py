@@ -6,7 +6,13 @@ in different scenarios and frameworks.
 """
 
 import os
-from huntglitch_python import HuntGlitchLogger, capture_exception_and_report
+import reprlib
+import sys
+from huntglitch_python import (
+    HuntGlitchLogger,
+    capture_exception_and_report,
+    get_default_logger,
+)
 
 # Example 1: Basic usage with environment variables
 
@@ -63,17 +69,13 @@ def manual_logging_example():
     Manually logging events without actual exceptions.
     Useful for custom events and debugging.
     """
-    logger = HuntGlitchLogger(
-        project_key=os.getenv("PROJECT_KEY"),
-        deliverable_key=os.getenv("DELIVERABLE_KEY")
-    )
+    # Keys come from PROJECT_KEY/DELIVERABLE_KEY, read by the first logger that needs them
+    logger = HuntGlitchLogger()
 
-    # Log a custom event
+    # Log a custom event; file_name/line_number default to this call site
     logger.send_log(
         error_name="CustomEvent",
         error_value="User login attempt failed",
-        file_name=__file__,
-        line_number=60,
         log_type="warning",  # Can use string or int
         additional_data={
             "username": "john_doe",
@@ -84,22 +86,38 @@ def manual_logging_example():
 
 
 # Example 4: Decorator for automatic error logging
+
+# Bounded repr: large arguments (DataFrames, arrays, long lists) are cut off
+# while being rendered instead of being stringified in full first
+_safe_repr = reprlib.Repr()
+_safe_repr.maxstring = 500
+_safe_repr.maxother = 500
+
+
 def error_logging_decorator(func):
     """
     Decorator that automatically logs exceptions from functions.
+
+    Safe to use around any callable: a failure while reporting is swallowed,
+    so the original exception always propagates unchanged.
     """
     def wrapper(*args, **kwargs):
         try:
             return func(*args, **kwargs)
         except Exception:
-            # Log the exception
-            capture_exception_and_report(
-                additional_data={
-                    "function_name": func.__name__,
-                    "args": str(args)[:500],  # Limit size
-                    "kwargs": str(kwargs)[:500]
-                }
-            )
+            # Capture once and hand it to the logger explicitly
+            exc_info = sys.exc_info()
+            try:
+                capture_exception_and_report(
+                    exc_info=exc_info,
+                    additional_data={
+                        "function_name": func.__name__,
+                        "args": _safe_repr.repr(args),  # Limit size
+                        "kwargs": _safe_repr.repr(kwargs)
+                    }
+                )
+            except Exception:
+                pass  # Never let reporting mask the original error
             # Re-raise the exception
             raise
     return wrapper
@@ -126,16 +144,15 @@ def flask_integration_example():
 
     app = Flask(__name__)
 
-    # Initialize logger
-    logger = HuntGlitchLogger(
-        project_key=os.getenv("PROJECT_KEY"),
-        deliverable_key=os.getenv("DELIVERABLE_KEY")
-    )
+    # Initialize logger once; its pooled HTTP session is safe to share
+    # between concurrent request handlers
+    logger = HuntGlitchLogger()
 
     @app.errorhandler(Exception)
     def handle_exception(e):
         """Global exception handler for Flask."""
         logger.capture_exception(
+            exc_info=(type(e), e, e.__traceback__),
             additional_data={
                 "request_url": request.url,
                 "request_method": request.method,
@@ -160,10 +177,8 @@ class ErrorLoggingContext:
     def __init__(self, operation_name, **extra_data):
         self.operation_name = operation_name
         self.extra_data = extra_data
-        self.logger = HuntGlitchLogger(
-            project_key=os.getenv("PROJECT_KEY"),
-            deliverable_key=os.getenv("DELIVERABLE_KEY")
-        )
+        # Shared process-wide logger instead of one per operation
+        self.logger = get_default_logger()
 
     def __enter__(self):
         return self
@@ -190,25 +205,24 @@ def context_manager_example():
 async def async_example():
     """
     Example with async/await.
-    The logger itself is not async, but can be used in async contexts.
+    acapture_exception() sends the log without blocking the event loop
+    (requires the "async" extra: pip install huntglitch-python[async]).
     """
     import asyncio
 
-    logger = HuntGlitchLogger(
-        project_key=os.getenv("PROJECT_KEY"),
-        deliverable_key=os.getenv("DELIVERABLE_KEY")
-    )
+    logger = get_default_logger()
 
     try:
         # Simulate async operation
         await asyncio.sleep(1)
         raise RuntimeError("Async operation failed")
     except Exception:
-        # Note: This is a synchronous call within async function
-        # For truly async logging, you'd need to wrap in asyncio.create_task
-        logger.capture_exception(
+        await logger.acapture_exception(
             additional_data={"operation_type": "async"}
         )
+    finally:
+        # Close the aiohttp session before this event loop goes away
+        await logger.aclose()
 
 
 # Example 8: Configuration validation
@@ -4,7 +4,15 @@ HuntGlitch Python Logger
 A Python package for sending exception logs and custom messages to the HuntGlitch.
 """
 
-from .logger import HuntGlitchLogger, send_huntglitch_log, capture_exception_and_report
+from .logger import (
+    HuntGlitchLogger,
+    send_huntglitch_log,
+    capture_exception_and_report,
+    get_default_logger,
+    set_default_logger,
+    reload_env,
+    flush,
+)
 
 __version__ = "1.2.0"
 __author__ = "HuntGlitch"
@@ -14,5 +22,9 @@ __email__ = "support@huntglitch.com"
 __all__ = [
     "HuntGlitchLogger",
     "send_huntglitch_log",
-    "capture_exception_and_report"
+    "capture_exception_and_report",
+    "get_default_logger",
+    "set_default_logger",
+    "reload_env",
+    "flush"
 ]
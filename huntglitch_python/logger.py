@@ -1,12 +1,14 @@
 import os
 import json
-import requests
 import sys
-import traceback
+import atexit
+import hashlib
+import threading
+import weakref
 import logging
 import time
-from typing import Optional, Dict, Any, Union
-from datetime import datetime
+from collections import OrderedDict, deque
+from typing import TYPE_CHECKING, Awaitable, Optional, Dict, Any, Set, Tuple, Union
 from pathlib import Path
 
 try:
@@ -15,10 +17,28 @@ try:
 except ImportError:
     DOTENV_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+if TYPE_CHECKING:
+    import aiohttp
+    import requests
+
 # Constants
 DEFAULT_TIMEOUT = 10
 DEFAULT_RETRIES = 3
 DEFAULT_RETRY_DELAY = 1.0
+DEDUPE_MAX_SIZE = 1024
+DEFAULT_POOL_SIZE = 32
+DEFAULT_FLUSH_INTERVAL = 5.0
+MAX_QUEUE_SIZE = 10000
+EXIT_FLUSH_TIMEOUT = 5.0
+COMPRESSION_THRESHOLD = 1024
+ZSTD_LEVEL = 3
+MAX_ERROR_VALUE_LENGTH = 1000
 HUNTGLITCH_URL = "https://api.huntglitch.com/add-log"
 
 # Log types mapping
@@ -30,10 +50,166 @@ LOG_TYPES = {
     'error': 5
 }
 
+# Every accepted spelling of a log type resolved in one dict lookup:
+# lower/upper-case names and the integer values themselves
+_LOG_TYPE_MAP: Dict[Union[int, str], int] = {
+    **LOG_TYPES,
+    **{name.upper(): value for name, value in LOG_TYPES.items()},
+    **{value: value for value in LOG_TYPES.values()},
+}
+
 # Setup internal logger
 logger = logging.getLogger(__name__)
 
 
+def _read_env_keys() -> Tuple[Optional[str], Optional[str]]:
+    """Read project and deliverable keys from the environment."""
+    return (
+        os.getenv("PROJECT_KEY") or os.getenv("HUNTGLITCH_PROJECT_KEY"),
+        os.getenv("DELIVERABLE_KEY") or os.getenv("HUNTGLITCH_DELIVERABLE_KEY"),
+    )
+
+
+# Environment configuration, read by the first logger construction that needs
+# it (not at import, so keys set after importing the package still apply)
+_ENV_PROJECT_KEY: Optional[str] = None
+_ENV_DELIVERABLE_KEY: Optional[str] = None
+_env_files_loaded = False
+
+
+def _env_keys() -> Tuple[Optional[str], Optional[str]]:
+    """Return the cached environment keys, reading them while any is missing."""
+    global _ENV_PROJECT_KEY, _ENV_DELIVERABLE_KEY
+    if not (_ENV_PROJECT_KEY and _ENV_DELIVERABLE_KEY):
+        _ENV_PROJECT_KEY, _ENV_DELIVERABLE_KEY = _read_env_keys()
+    return _ENV_PROJECT_KEY, _ENV_DELIVERABLE_KEY
+
+
+def reload_env() -> None:
+    """
+    Forget the cached PROJECT_KEY/DELIVERABLE_KEY values.
+
+    Call this after changing already-set keys in os.environ at runtime (e.g.
+    in tests); the next logger reads them again and .env files are searched
+    again by the next logger created with load_env=True.
+    """
+    global _ENV_PROJECT_KEY, _ENV_DELIVERABLE_KEY, _env_files_loaded
+    _ENV_PROJECT_KEY = _ENV_DELIVERABLE_KEY = None
+    _env_files_loaded = False
+
+
+if ORJSON_AVAILABLE:
+    _dumps = orjson.dumps
+    # numpy values and non-str keys, like json.dumps allows; datetimes go
+    # through default=str so they keep the stdlib encoder's format
+    _LOG_DATA_OPTIONS = (
+        orjson.OPT_SERIALIZE_NUMPY
+        | orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+    )
+
+    def _dumps_log_data(obj: Any) -> str:
+        """Serialize user-supplied log data, stringifying unknown types."""
+        try:
+            return orjson.dumps(obj, default=str, option=_LOG_DATA_OPTIONS).decode("utf-8")
+        except TypeError:
+            # e.g. integers beyond 64 bits, which only the stdlib encoder handles
+            return json.dumps(obj, default=str)
+else:
+    def _dumps(obj: Any) -> bytes:
+        """Serialize to compact JSON bytes with the standard library."""
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    def _dumps_log_data(obj: Any) -> str:
+        """Serialize user-supplied log data, stringifying unknown types."""
+        return json.dumps(obj, default=str)
+
+
+# Most recent whole second and its formatted "YYYY-MM-DDTHH:MM:SS." prefix.
+# Replaced as a single tuple, so readers never see a torn update.
+_ts_cache: Tuple[int, str] = (0, "")
+
+
+def _timestamp() -> str:
+    """Return the current UTC time in ISO 8601 format with microseconds."""
+    global _ts_cache
+    now = time.time()
+    second = int(now)
+    cached_second, prefix = _ts_cache
+    if cached_second != second:
+        # Only the first log in each second pays for strftime
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S.", time.gmtime(second))
+        _ts_cache = (second, prefix)
+    return f"{prefix}{int((now - second) * 1_000_000):06d}"
+
+
+# requests (with urllib3, idna, charset_normalizer, ssl) is imported on the
+# first send, so importing the package or creating loggers stays cheap
+_requests: Any = None
+
+
+def _import_requests() -> Any:
+    """Import requests on first use."""
+    global _requests
+    if _requests is None:
+        import requests as _requests
+    return _requests
+
+
+# zstandard compressors are not safe for concurrent use, so keep one per thread
+_zstd_local = threading.local()
+
+
+def _zstd_compress(body: bytes) -> bytes:
+    """Compress a request body with this thread's zstd compressor."""
+    compressor = getattr(_zstd_local, "compressor", None)
+    if compressor is None:
+        import zstandard
+        compressor = _zstd_local.compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL)
+    return compressor.compress(body)
+
+
+# Shared by all loggers so TCP/TLS connections are reused between logs.
+# requests.Session is safe to share across threads for plain POSTs.
+_session: Optional["requests.Session"] = None
+_session_lock = threading.Lock()
+
+# Loggers holding a request template built from a session, so a forked child
+# can drop templates (and their cached settings) tied to the parent's pool
+_prepared_loggers: "weakref.WeakSet[HuntGlitchLogger]" = weakref.WeakSet()
+
+
+def _get_session() -> "requests.Session":
+    """Get or create the shared HTTP session with a keep-alive connection pool."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                requests = _import_requests()
+                session = requests.Session()
+                session.mount(
+                    "https://",
+                    requests.adapters.HTTPAdapter(pool_maxsize=DEFAULT_POOL_SIZE)
+                )
+                _session = session
+    return _session
+
+
+# Background delivery queue shared by loggers created with background=True.
+# deque.append/popleft are atomic, so producers never take a lock. The queue
+# is bounded so an unreachable endpoint cannot grow it without limit.
+_queue: deque = deque(maxlen=MAX_QUEUE_SIZE)
+_queue_event = threading.Event()
+_worker_lock = threading.Lock()
+_worker: Optional[threading.Thread] = None
+_dropped_logs = 0
+
+# Loggers holding buffered low-severity logs, flushed by the worker and at
+# interpreter exit. Held strongly while their buffer is non-empty, so logs
+# buffered by a logger that is then dropped are still delivered.
+_buffered_loggers: "Set[HuntGlitchLogger]" = set()
+
+
 class HuntGlitchError(Exception):
     """Base exception for HuntGlitch errors."""
     pass
@@ -53,8 +229,16 @@ class HuntGlitchLogger:
     """
     Production-ready HuntGlitch logger with configuration management,
     error handling, and retry logic.
+
+    Configuration attributes are assigned once in __init__ and read without
+    locking on the send path; create a new logger to change them.
     """
 
+    # Endpoint and headers are identical for every log; treat as read-only
+    _url = HUNTGLITCH_URL
+    _headers = {"Content-Type": "application/json", "Accept": "application/json"}
+    _compressed_headers = {**_headers, "Content-Encoding": "zstd"}
+
     def __init__(
         self,
         project_key: Optional[str] = None,
@@ -63,7 +247,13 @@ class HuntGlitchLogger:
         retries: int = DEFAULT_RETRIES,
         retry_delay: float = DEFAULT_RETRY_DELAY,
         silent_failures: bool = True,
-        load_env: bool = True
+        load_env: bool = True,
+        background: bool = False,
+        dedupe_ttl: float = 0,
+        session: Optional["requests.Session"] = None,
+        batch_max: int = 0,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        compress: bool = False
     ):
         """
         Initialize HuntGlitch logger.
@@ -76,25 +266,89 @@ class HuntGlitchLogger:
             retry_delay: Delay between retries in seconds
             silent_failures: If True, log errors instead of raising
             load_env: Whether to load environment variables
+            background: If True, queue logs and send them from a background
+                thread instead of blocking the caller
+            dedupe_ttl: Suppress identical exceptions captured again within
+                this many seconds (0 disables deduplication)
+            session: HTTP session to send logs with. Defaults to a pooled
+                session shared by all loggers
+            batch_max: Buffer debug/info/notice/warning logs and hand them to
+                the background worker once this many are pending (0 disables
+                buffering). Implies background=True
+            flush_interval: Send buffered logs at most this many seconds after
+                the first of them was buffered
+            compress: Send bodies larger than 1 KB zstd-compressed with
+                Content-Encoding: zstd (requires the "compress" extra and
+                an endpoint that accepts zstd request bodies)
         """
         self.timeout = timeout
         self.retries = retries
         self.retry_delay = retry_delay
         self.silent_failures = silent_failures
+        # Buffered logs are only ever sent by the background worker
+        self.background = background or bool(batch_max)
+        self.dedupe_ttl = dedupe_ttl
+        self._custom_session = session
+        self._send_settings: Optional[Dict[str, Any]] = None
+        self._request_template: Optional["requests.PreparedRequest"] = None
+        # aiohttp sessions are bound to the loop that created them: one per loop
+        self._aio_sessions: "weakref.WeakKeyDictionary[Any, aiohttp.ClientSession]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._aio_lock = threading.Lock()
+        self._dedupe_cache: "OrderedDict[bytes, list]" = OrderedDict()
+        self._dedupe_lock = threading.Lock()
+        self.batch_max = batch_max
+        self.flush_interval = flush_interval
+        # deque.append/popleft are atomic, so buffering needs no lock
+        self._buffer: deque = deque()
+        self._buffer_started = time.monotonic()
+        self.compress = compress
+
+        if self.compress:
+            try:
+                import zstandard  # noqa: F401
+            except ImportError as e:
+                raise ConfigurationError(
+                    "compress=True requires zstandard. "
+                    "Install it with: pip install huntglitch-python[compress]"
+                ) from e
 
         # Load environment variables if requested and available
         if load_env and DOTENV_AVAILABLE:
             self._load_env_files()
 
         # Set configuration
-        self.project_key = project_key or os.getenv("PROJECT_KEY") or os.getenv("HUNTGLITCH_PROJECT_KEY")
-        self.deliverable_key = deliverable_key or os.getenv("DELIVERABLE_KEY") or os.getenv("HUNTGLITCH_DELIVERABLE_KEY")
+        if project_key and deliverable_key:
+            self.project_key, self.deliverable_key = project_key, deliverable_key
+        else:
+            env_project_key, env_deliverable_key = _env_keys()
+            self.project_key = project_key or env_project_key
+            self.deliverable_key = deliverable_key or env_deliverable_key
 
         # Validate configuration
         self._validate_config()
 
+        # Project keys never change, so encode them once: b'{"vp":..,"vd":..,'
+        self._static_prefix = _dumps({
+            "vp": self.project_key,
+            "vd": self.deliverable_key,
+        })[:-1] + b","
+
+        if self.background:
+            _start_worker()
+
+    @property
+    def session(self) -> "requests.Session":
+        """HTTP session used for sync sends."""
+        return self._custom_session or _get_session()
+
     def _load_env_files(self):
-        """Load environment variables from various .env file locations."""
+        """Load environment variables from various .env file locations once per process."""
+        global _env_files_loaded, _ENV_PROJECT_KEY, _ENV_DELIVERABLE_KEY
+        if _env_files_loaded:
+            return
+
         env_files = [
             '.env',
             '.env.local',
@@ -109,8 +363,12 @@ class HuntGlitchLogger:
             if env_file.exists():
                 load_dotenv(env_file)
                 logger.debug(f"Loaded environment from {env_file}")
+                # Pick up keys defined in the file on the next lookup
+                _ENV_PROJECT_KEY = _ENV_DELIVERABLE_KEY = None
                 break
 
+        _env_files_loaded = True
+
     def _validate_config(self):
         """Validate configuration."""
         if not self.project_key:
@@ -132,7 +390,7 @@ class HuntGlitchLogger:
     ) -> Dict[str, Any]:
         """Prepare error data structure."""
         return {
-            "c": str(error_value)[:1000],  # Limit error message length
+            "c": str(error_value)[:MAX_ERROR_VALUE_LENGTH],  # Limit error message length
             "d": str(file_name),
             "e": [],
             "f": int(line_number),
@@ -159,7 +417,7 @@ class HuntGlitchLogger:
             "l": request_body or {},
             "m": request_url or "",
             "n": request_method,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _timestamp(),
         }
 
     def _prepare_payload(
@@ -168,38 +426,112 @@ class HuntGlitchLogger:
         log_type: Union[int, str],
         ip_address: str = "0.0.0.0"
     ) -> Dict[str, Any]:
-        """Prepare API payload."""
-        # Convert string log type to int
-        if isinstance(log_type, str):
-            log_type = LOG_TYPES.get(log_type.lower(), 5)
+        """Prepare the per-log part of the API payload."""
+        # Map names and ints 1-5 to their level with one lookup; only str/int
+        # values are looked up (not bool, so True stays True)
+        level = None
+        if isinstance(log_type, (str, int)) and not isinstance(log_type, bool):
+            level = _LOG_TYPE_MAP.get(log_type)
+        if level is None:
+            # Mixed-case names, unknown names (default: error), custom ints
+            # and other values, which pass through unchanged as before
+            level = LOG_TYPES.get(log_type.lower(), 5) if isinstance(log_type, str) else log_type
 
         return {
-            "vp": self.project_key,
-            "vd": self.deliverable_key,
-            "o": log_type,
-            "a": json.dumps(log_data, default=str),  # Handle datetime serialization
+            "o": level,
+            "a": _dumps_log_data(log_data),  # Handle datetime serialization
             "r": ip_address,
         }
 
-    def _make_request(self, payload: Dict[str, Any]) -> Optional[requests.Response]:
-        """Make HTTP request with retry logic."""
-        headers = {"Content-Type": "application/json"}
+    def _check_duplicate(self, key: bytes) -> Optional[int]:
+        """
+        Record an occurrence of an exception site.
+
+        Returns:
+            Optional[int]: None if the occurrence should be suppressed,
+            otherwise the number of duplicates suppressed since the site
+            was last reported
+        """
+        now = time.monotonic()
+        with self._dedupe_lock:
+            entry = self._dedupe_cache.get(key)
+            if entry is not None and entry[0] > now:
+                entry[1] += 1
+                return None
 
-        for attempt in range(self.retries + 1):
+            suppressed = entry[1] if entry is not None else 0
+            self._dedupe_cache[key] = [now + self.dedupe_ttl, 0]
+            self._dedupe_cache.move_to_end(key)
+            while len(self._dedupe_cache) > DEDUPE_MAX_SIZE:
+                self._dedupe_cache.popitem(last=False)
+            return suppressed
+
+    def _encode_payload(self, payload: Dict[str, Any]) -> bytes:
+        """Encode a payload behind the precomputed project key prefix."""
+        return self._static_prefix + _dumps(payload)[1:]
+
+    def _maybe_compress(self, body: bytes) -> Tuple[bytes, bool]:
+        """Compress large bodies when enabled; returns (body, compressed)."""
+        if self.compress and len(body) > COMPRESSION_THRESHOLD:
+            return _zstd_compress(body), True
+        return body, False
+
+    def _prepare_request(self, body: bytes) -> "requests.PreparedRequest":
+        """
+        Build the POST request for an encoded log.
+
+        Session.post re-merges session headers, auth, cookies, proxy and
+        netrc settings on every call. Do that once per logger and only
+        attach the body per log; proxy settings are read from the
+        environment on the first send.
+        """
+        if self._request_template is None:
+            requests = _import_requests()
+            self._send_settings = self.session.merge_environment_settings(
+                self._url, {}, None, None, None
+            )
+            self._request_template = self.session.prepare_request(
+                requests.Request("POST", self._url, headers=self._headers)
+            )
+            _prepared_loggers.add(self)
+        prepared = self._request_template.copy()
+        body, compressed = self._maybe_compress(body)
+        if compressed:
+            prepared.headers["Content-Encoding"] = "zstd"
+        prepared.prepare_body(body, None)
+        return prepared
+
+    def _make_request(
+        self,
+        body: bytes,
+        retries: Optional[int] = None,
+        timeout: Optional[float] = None
+    ) -> Optional["requests.Response"]:
+        """
+        Make HTTP request with retry logic.
+
+        retries and timeout override the logger's settings for this request
+        (used to bound the drain at interpreter exit).
+        """
+        requests = _import_requests()
+        prepared = self._prepare_request(body)
+        retries = self.retries if retries is None else retries
+        timeout = self.timeout if timeout is None else timeout
+
+        for attempt in range(retries + 1):
             try:
-                response = requests.post(
-                    HUNTGLITCH_URL,
-                    data=json.dumps(payload),
-                    headers=headers,
-                    timeout=self.timeout
+                response = self.session.send(
+                    prepared,
+                    timeout=timeout,
+                    **(self._send_settings or {})
                 )
                 response.raise_for_status()
                 return response
 
             except requests.exceptions.RequestException as e:
-                if attempt == self.retries:
+                if attempt == retries:
                     # Last attempt failed
-                    error_msg = f"Failed to send log to HuntGlitch after {self.retries + 1} attempts: {e}"
+                    error_msg = f"Failed to send log to HuntGlitch after {retries + 1} attempts: {e}"
                     if self.silent_failures:
                         logger.error(error_msg)
                         return None
@@ -208,11 +540,68 @@ class HuntGlitchLogger:
                 else:
                     # Retry with delay
                     time.sleep(self.retry_delay * (2 ** attempt))  # Exponential backoff
-                    logger.warning(f"Request failed, retrying... (attempt {attempt + 1}/{self.retries + 1})")
+                    logger.warning(f"Request failed, retrying... (attempt {attempt + 1}/{retries + 1})")
 
         return None
 
-    def send_log(
+    def _dispatch(self, body: bytes) -> bool:
+        """Send an encoded log now, or hand it to the background worker."""
+        if self.background:
+            global _dropped_logs
+            if len(_queue) >= MAX_QUEUE_SIZE:
+                if not _dropped_logs:
+                    logger.warning("HuntGlitch background queue is full; dropping logs")
+                _dropped_logs += 1
+                return False
+            # Cheap when the worker is alive; restarts it e.g. after fork()
+            _start_worker()
+            _queue.append((self, body))
+            _queue_event.set()
+            return True
+        return self._make_request(body) is not None
+
+    def _buffer_log(self, body: bytes) -> bool:
+        """Buffer a low-severity log, flushing once the batch is full."""
+        was_empty = not self._buffer
+        self._buffer.append(body)
+        if len(self._buffer) >= self.batch_max:
+            self.flush()
+        elif was_empty:
+            # Wake the worker so it schedules the flush_interval deadline
+            _buffered_loggers.add(self)
+            self._buffer_started = time.monotonic()
+            _start_worker()
+            _queue_event.set()
+        return True
+
+    def _buffer_deadline(self) -> Optional[float]:
+        """Monotonic time at which the current buffer is due, if non-empty."""
+        if not self._buffer:
+            return None
+        return self._buffer_started + self.flush_interval
+
+    def flush(self) -> int:
+        """
+        Hand all buffered low-severity logs to the background queue.
+
+        Returns:
+            int: Number of logs flushed
+        """
+        flushed = 0
+        # Concurrent flushes split the pending logs; each is popped exactly once
+        while True:
+            try:
+                body = self._buffer.popleft()
+            except IndexError:
+                _buffered_loggers.discard(self)
+                # A log buffered while discarding keeps the logger tracked
+                if self._buffer:
+                    _buffered_loggers.add(self)
+                return flushed
+            self._dispatch(body)
+            flushed += 1
+
+    def _build_body(
         self,
         error_name: str,
         error_value: str,
@@ -228,27 +617,74 @@ class HuntGlitchLogger:
         request_body: Optional[Dict[str, Any]] = None,
         request_url: Optional[str] = None,
         request_method: str = "GET"
+    ) -> Tuple[int, bytes]:
+        """Prepare and encode a log entry; returns its log type and request body."""
+        error_data = self._prepare_error_data(
+            error_name, error_value, file_name, line_number, error_code
+        )
+
+        log_data = self._prepare_log_data(
+            error_data, additional_data, tags, request_headers,
+            request_body, request_url, request_method
+        )
+
+        payload = self._prepare_payload(log_data, log_type, ip_address)
+        return payload["o"], self._encode_payload(payload)
+
+    def send_log(
+        self,
+        error_name: str,
+        error_value: str,
+        file_name: Optional[str] = None,
+        line_number: Optional[int] = None,
+        *,
+        error_code: int = 0,
+        log_type: Union[int, str] = 5,
+        ip_address: str = "0.0.0.0",
+        additional_data: Optional[Dict[str, Any]] = None,
+        tags: Optional[Dict[str, Any]] = None,
+        request_headers: Optional[Dict[str, Any]] = None,
+        request_body: Optional[Dict[str, Any]] = None,
+        request_url: Optional[str] = None,
+        request_method: str = "GET"
     ) -> bool:
         """
         Send a log entry to HuntGlitch.
 
+        In background mode the log is queued and True is returned as soon as
+        it is accepted; delivery failures are then reported through the
+        internal logger only. With batch_max set, logs below error severity
+        are buffered until batch_max are pending or flush_interval expires;
+        errors flush the buffer and are queued right away.
+
+        file_name and line_number default to the location of the caller.
+
         Returns:
             bool: True if successful, False if failed (when silent_failures=True)
         """
         try:
-            error_data = self._prepare_error_data(
-                error_name, error_value, file_name, line_number, error_code
-            )
+            if file_name is None or line_number is None:
+                file_name, line_number = _resolve_location(file_name, line_number)
 
-            log_data = self._prepare_log_data(
-                error_data, additional_data, tags, request_headers,
-                request_body, request_url, request_method
+            level, body = self._build_body(
+                error_name, error_value, file_name, line_number,
+                error_code=error_code,
+                log_type=log_type,
+                ip_address=ip_address,
+                additional_data=additional_data,
+                tags=tags,
+                request_headers=request_headers,
+                request_body=request_body,
+                request_url=request_url,
+                request_method=request_method
             )
 
-            payload = self._prepare_payload(log_data, log_type, ip_address)
+            if self.batch_max:
+                if level < LOG_TYPES["error"]:
+                    return self._buffer_log(body)
+                self.flush()
 
-            response = self._make_request(payload)
-            return response is not None
+            return self._dispatch(body)
 
         except Exception as e:
             error_msg = f"Unexpected error in send_log: {e}"
@@ -258,14 +694,20 @@ class HuntGlitchLogger:
             else:
                 raise HuntGlitchError(error_msg) from e
 
-    def capture_exception(self, **kwargs) -> bool:
+    def _exception_log_kwargs(
+        self,
+        exc_info: Optional[Tuple[Any, Any, Any]],
+        kwargs: Dict[str, Any]
+    ) -> Union[bool, Dict[str, Any]]:
         """
-        Capture current exception and send to HuntGlitch.
+        Build send_log arguments for an exception (the active one by default).
 
         Returns:
-            bool: True if successful, False if failed
+            The send_log keyword arguments, or the result to return directly
+            when there is nothing to send (no active exception, or a
+            suppressed duplicate)
         """
-        exc_type, exc_value, exc_traceback = sys.exc_info()
+        exc_type, exc_value, exc_traceback = exc_info or sys.exc_info()
 
         if exc_type is None:
             if not self.silent_failures:
@@ -273,19 +715,194 @@ class HuntGlitchLogger:
             logger.warning("No active exception to capture")
             return False
 
+        file_name, line_number, error_value, key = _exception_site(
+            exc_value, exc_traceback
+        )
+
+        if self.dedupe_ttl:
+            suppressed = self._check_duplicate(key)
+            if suppressed is None:
+                return True
+            if suppressed:
+                kwargs["additional_data"] = {
+                    **(kwargs.get("additional_data") or {}),
+                    "duplicate_count": suppressed,
+                }
+
+        return dict(
+            kwargs,
+            error_name=exc_type.__name__,
+            error_value=error_value,
+            file_name=file_name,
+            line_number=line_number,
+        )
+
+    def capture_exception(
+        self,
+        exc_info: Optional[Tuple[Any, Any, Any]] = None,
+        **kwargs: Any
+    ) -> bool:
+        """
+        Capture current exception and send to HuntGlitch.
+
+        Pass exc_info (a sys.exc_info() tuple) to report an exception
+        captured earlier instead of the one currently being handled.
+
+        When dedupe_ttl is set, repeats of the same exception from the same
+        call path within the window are counted instead of sent; the next
+        report for that site carries the count in additional_data as
+        "duplicate_count".
+
+        Returns:
+            bool: True if successful, False if failed
+        """
+        try:
+            log_kwargs = self._exception_log_kwargs(exc_info, kwargs)
+            if isinstance(log_kwargs, bool):
+                return log_kwargs
+            return self.send_log(**log_kwargs)
+        except HuntGlitchError:
+            raise
+        except Exception as e:
+            error_msg = f"Failed to capture exception: {e}"
+            if self.silent_failures:
+                logger.error(error_msg)
+                return False
+            else:
+                raise HuntGlitchError(error_msg) from e
+
+    def _get_aio_session(self) -> "aiohttp.ClientSession":
+        """
+        Get or lazily create the aiohttp session for the running event loop.
+
+        Each loop (e.g. one per thread, or a second asyncio.run()) gets its
+        own session, so loops never disturb each other's connections.
+        """
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        session = self._aio_sessions.get(loop)
+        if session is None or session.closed:
+            aiohttp = _import_aiohttp()
+            with self._aio_lock:
+                session = self._aio_sessions.get(loop)
+                if session is None or session.closed:
+                    session = self._aio_sessions[loop] = aiohttp.ClientSession(
+                        connector=aiohttp.TCPConnector(
+                            limit=DEFAULT_POOL_SIZE, ttl_dns_cache=300
+                        )
+                    )
+        return session
+
+    async def _amake_request(self, body: bytes) -> bool:
+        """Make HTTP request with retry logic without blocking the event loop."""
+        import asyncio
+
+        aiohttp = _import_aiohttp()
+        session = self._get_aio_session()
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        body, compressed = self._maybe_compress(body)
+        headers = self._compressed_headers if compressed else self._headers
+
+        for attempt in range(self.retries + 1):
+            try:
+                async with session.post(
+                    self._url,
+                    data=body,
+                    headers=headers,
+                    timeout=timeout
+                ) as response:
+                    response.raise_for_status()
+                    return True
+
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt == self.retries:
+                    # Last attempt failed
+                    error_msg = f"Failed to send log to HuntGlitch after {self.retries + 1} attempts: {e}"
+                    if self.silent_failures:
+                        logger.error(error_msg)
+                        return False
+                    else:
+                        raise APIError(error_msg) from e
+                else:
+                    # Retry with delay
+                    await asyncio.sleep(self.retry_delay * (2 ** attempt))  # Exponential backoff
+                    logger.warning(f"Request failed, retrying... (attempt {attempt + 1}/{self.retries + 1})")
+
+        return False
+
+    def asend_log(
+        self,
+        error_name: str,
+        error_value: str,
+        file_name: Optional[str] = None,
+        line_number: Optional[int] = None,
+        **kwargs: Any
+    ) -> Awaitable[bool]:
+        """
+        Send a log entry to HuntGlitch from async code.
+
+        Accepts the same arguments as send_log(). The log is always sent
+        right away over a shared aiohttp session (requires the "async"
+        extra); background and batch_max settings apply to the sync API only.
+
+        file_name and line_number default to the location of the caller. They
+        are resolved when asend_log() is called, so they stay correct when the
+        returned coroutine is scheduled with asyncio.create_task().
+
+        Returns:
+            Awaitable[bool]: Resolves to True if successful, False if failed
+            (when silent_failures=True)
+        """
+        if file_name is None or line_number is None:
+            file_name, line_number = _resolve_location(file_name, line_number)
+        return self._asend_log(error_name, error_value, file_name, line_number, **kwargs)
+
+    async def _asend_log(
+        self,
+        error_name: str,
+        error_value: str,
+        file_name: str,
+        line_number: int,
+        **kwargs: Any
+    ) -> bool:
+        """Build and send a log whose location is already resolved."""
         try:
-            # Get the last frame from traceback
-            tb_frame = traceback.extract_tb(exc_traceback)[-1]
-            file_name = tb_frame.filename
-            line_number = tb_frame.lineno
-
-            return self.send_log(
-                error_name=exc_type.__name__,
-                error_value=str(exc_value),
-                file_name=file_name,
-                line_number=line_number,
-                **kwargs
+            _, body = self._build_body(
+                error_name, error_value, file_name, line_number, **kwargs
             )
+            return await self._amake_request(body)
+
+        except HuntGlitchError:
+            raise
+        except Exception as e:
+            error_msg = f"Unexpected error in asend_log: {e}"
+            if self.silent_failures:
+                logger.error(error_msg)
+                return False
+            else:
+                raise HuntGlitchError(error_msg) from e
+
+    async def acapture_exception(
+        self,
+        exc_info: Optional[Tuple[Any, Any, Any]] = None,
+        **kwargs: Any
+    ) -> bool:
+        """
+        Capture current exception and send to HuntGlitch from async code.
+
+        Async counterpart of capture_exception(); see asend_log().
+
+        Returns:
+            bool: True if successful, False if failed
+        """
+        try:
+            log_kwargs = self._exception_log_kwargs(exc_info, kwargs)
+            if isinstance(log_kwargs, bool):
+                return log_kwargs
+            return await self.asend_log(**log_kwargs)
+        except HuntGlitchError:
+            raise
         except Exception as e:
             error_msg = f"Failed to capture exception: {e}"
             if self.silent_failures:
@@ -294,24 +911,285 @@ class HuntGlitchLogger:
             else:
                 raise HuntGlitchError(error_msg) from e
 
+    async def aclose(self) -> None:
+        """
+        Close the aiohttp sessions used by the async API on every event loop.
+
+        Sessions of loops running in other threads are closed on their own
+        loop. Await this before a loop that used the async API shuts down
+        (e.g. at the end of the coroutine passed to asyncio.run()): a session
+        whose loop has already stopped cannot be closed and is only dropped.
+        The next async call creates a fresh session.
+        """
+        import asyncio
+
+        current = asyncio.get_running_loop()
+        with self._aio_lock:
+            sessions = list(self._aio_sessions.items())
+            self._aio_sessions.clear()
+
+        for loop, session in sessions:
+            if session.closed:
+                continue
+            if loop is current:
+                await session.close()
+            elif loop.is_running():
+                await asyncio.wrap_future(
+                    asyncio.run_coroutine_threadsafe(session.close(), loop)
+                )
+
+
+def _caller_location(depth: int) -> Tuple[str, int]:
+    """
+    Return (file_name, line_number) of the code that called our caller.
+
+    depth counts frames above the function invoking this helper. CPython's
+    sys._getframe fetches that single frame directly, where inspect.stack()
+    would build FrameInfo objects (and read source) for the whole stack;
+    interpreters without sys._getframe fall back to inspect.
+    """
+    getframe = getattr(sys, "_getframe", None)
+    if getframe is not None:
+        frame = getframe(depth + 1)
+    else:
+        import inspect
+        frame = inspect.stack(context=0)[depth + 1].frame
+    return frame.f_code.co_filename, frame.f_lineno
+
+
+def _resolve_location(
+    file_name: Optional[str],
+    line_number: Optional[int]
+) -> Tuple[str, int]:
+    """Fill in a missing file_name/line_number from the caller of our caller."""
+    caller_file, caller_line = _caller_location(2)
+    return (
+        caller_file if file_name is None else file_name,
+        caller_line if line_number is None else line_number,
+    )
+
+
+def _import_aiohttp() -> Any:
+    """Import aiohttp on first use of the async API."""
+    try:
+        import aiohttp
+    except ImportError as e:
+        raise HuntGlitchError(
+            "aiohttp is required for async logging. "
+            "Install it with: pip install huntglitch-python[async]"
+        ) from e
+    return aiohttp
+
+
+def _exception_site(exc_value: BaseException, exc_traceback: Any) -> Tuple[str, int, str, bytes]:
+    """
+    Return (file_name, line_number, error_value, dedupe_key) for an exception.
+
+    The result is cached on the exception object, so reporting the same
+    exception twice (e.g. from a decorator and a framework error handler)
+    walks its traceback and stringifies it only once.
+    """
+    site = getattr(exc_value, "_huntglitch_site", None)
+    if site is not None:
+        return site
+
+    # Walk the traceback directly; extract_tb would also load source lines.
+    # An exception that was never raised has no traceback and no site.
+    file_name, line_number = "unknown", 0
+    path = []
+    tb = exc_traceback
+    while tb is not None:
+        file_name = tb.tb_frame.f_code.co_filename
+        line_number = tb.tb_lineno
+        path.append(f"{file_name}:{line_number}")
+        tb = tb.tb_next
+
+    key = hashlib.blake2b(
+        f"{type(exc_value).__name__}|{file_name}|{line_number}|{'|'.join(path)}".encode(),
+        digest_size=16
+    ).digest()
+    site = (file_name, line_number, str(exc_value), key)
+
+    try:
+        exc_value._huntglitch_site = site  # type: ignore[attr-defined]
+    except (AttributeError, TypeError):
+        pass  # Exception types with __slots__ cannot carry the cache
+    return site
+
+
+def _drain_queue(timeout: Optional[float] = None) -> int:
+    """
+    Send every queued log from the calling thread.
+
+    With a timeout, each log is tried once (no retries) and draining stops
+    when the deadline passes; logs left over are discarded and counted as
+    dropped.
+    """
+    global _dropped_logs
+    deadline = None if timeout is None else time.monotonic() + timeout
+    sent = 0
+    while True:
+        try:
+            logger_instance, body = _queue.popleft()
+        except IndexError:
+            return sent
+        try:
+            if deadline is None:
+                logger_instance._make_request(body)
+            else:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    _dropped_logs += len(_queue) + 1
+                    _queue.clear()
+                    return sent
+                logger_instance._make_request(
+                    body, retries=0, timeout=min(logger_instance.timeout, remaining)
+                )
+        except Exception as e:
+            logger.error(f"Failed to send queued log to HuntGlitch: {e}")
+        sent += 1
+
+
+def _flush_due_buffers() -> Optional[float]:
+    """
+    Flush buffered loggers whose flush_interval has expired.
+
+    Returns:
+        Optional[float]: Seconds until the next buffer is due, or None if
+        no logger has buffered logs
+    """
+    now = time.monotonic()
+    next_due = None
+    for logger_instance in list(_buffered_loggers):
+        due = logger_instance._buffer_deadline()
+        if due is None:
+            continue
+        if due <= now:
+            logger_instance.flush()
+        elif next_due is None or due < next_due:
+            next_due = due
+    return None if next_due is None else next_due - now
+
+
+def _worker_loop():
+    """Wait for queued logs and deliver them until the interpreter exits."""
+    wait_timeout = None
+    while True:
+        _queue_event.wait(wait_timeout)
+        _queue_event.clear()
+        try:
+            wait_timeout = _flush_due_buffers()
+        except Exception as e:
+            wait_timeout = None
+            logger.error(f"Failed to flush buffered logs to HuntGlitch: {e}")
+        _drain_queue()
+
+
+def _start_worker():
+    """Start the background delivery thread if it is not running yet."""
+    global _worker
+    # Only take the lock when the worker is missing, not on every logger
+    if _worker is not None and _worker.is_alive():
+        return
+    with _worker_lock:
+        if _worker is None or not _worker.is_alive():
+            _worker = threading.Thread(
+                target=_worker_loop, name="huntglitch-worker", daemon=True
+            )
+            _worker.start()
+
+
+def flush(timeout: Optional[float] = None) -> int:
+    """
+    Send all buffered logs and everything still waiting in the background queue.
+
+    Args:
+        timeout: Give up after this many seconds, trying each log only once
+            (None sends everything with the loggers' normal retries)
+
+    Returns:
+        int: Number of queued logs processed
+    """
+    for logger_instance in list(_buffered_loggers):
+        try:
+            logger_instance.flush()
+        except Exception as e:
+            logger.error(f"Failed to flush buffered logs to HuntGlitch: {e}")
+    return _drain_queue(timeout)
+
+
+def _flush_at_exit():
+    """Drain pending logs at interpreter exit without hanging shutdown."""
+    flush(timeout=EXIT_FLUSH_TIMEOUT)
+    if _dropped_logs:
+        logger.warning(f"HuntGlitch dropped {_dropped_logs} undelivered logs")
+
+
+def _reset_after_fork():
+    """
+    Give a forked child its own worker and connection pool.
+
+    The parent sends what it queued; the child must not reuse the parent's
+    keep-alive sockets, so the shared session is rebuilt on its next send.
+    """
+    global _worker, _worker_lock, _session, _session_lock
+    _worker = None
+    _worker_lock = threading.Lock()
+    _session = None
+    _session_lock = threading.Lock()
+    for logger_instance in list(_prepared_loggers):
+        logger_instance._request_template = None
+        logger_instance._send_settings = None
+    _queue.clear()
+    _queue_event.clear()
+    for logger_instance in list(_buffered_loggers):
+        logger_instance._buffer.clear()
+    _buffered_loggers.clear()
+
+
+atexit.register(_flush_at_exit)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
 
 # Global logger instance for backward compatibility
-_default_logger = None
+_default_logger: Optional[HuntGlitchLogger] = None
+_default_logger_lock = threading.Lock()
+
 
+def get_default_logger() -> HuntGlitchLogger:
+    """
+    Get or create the process-wide default logger.
 
-def _get_default_logger() -> HuntGlitchLogger:
-    """Get or create default logger instance."""
+    The logger is built from environment configuration on first use and
+    shared afterwards, so callers can fetch it wherever they need it.
+    """
     global _default_logger
+    # Double-checked locking: the lock is only taken until the first logger exists
     if _default_logger is None:
-        _default_logger = HuntGlitchLogger()
+        with _default_logger_lock:
+            if _default_logger is None:
+                _default_logger = HuntGlitchLogger()
     return _default_logger
 
 
+def set_default_logger(logger_instance: Optional[HuntGlitchLogger]) -> None:
+    """
+    Replace the default logger, e.g. with an explicitly configured one.
+
+    Passing None resets it so the next call to get_default_logger()
+    creates a fresh instance.
+    """
+    global _default_logger
+    with _default_logger_lock:
+        _default_logger = logger_instance
+
+
 def send_huntglitch_log(
     error_name: str,
     error_value: str,
-    file_name: str,
-    line_number: int,
+    file_name: Optional[str] = None,
+    line_number: Optional[int] = None,
     *,
     error_code: int = 0,
     log_type: Union[int, str] = 5,
@@ -328,7 +1206,10 @@ def send_huntglitch_log(
 
     This function maintains backward compatibility with the original API.
     """
-    logger_instance = _get_default_logger()
+    if file_name is None or line_number is None:
+        file_name, line_number = _resolve_location(file_name, line_number)
+
+    logger_instance = get_default_logger()
     return logger_instance.send_log(
         error_name=error_name,
         error_value=error_value,
@@ -346,11 +1227,15 @@ def send_huntglitch_log(
     )
 
 
-def capture_exception_and_report(**kwargs) -> bool:
+def capture_exception_and_report(
+    exc_info: Optional[Tuple[Any, Any, Any]] = None,
+    **kwargs: Any
+) -> bool:
     """
     Capture current exception and report using the default logger.
 
     This function maintains backward compatibility with the original API.
+    Pass exc_info (a sys.exc_info() tuple) to report a specific exception.
     """
-    logger_instance = _get_default_logger()
-    return logger_instance.capture_exception(**kwargs)
+    logger_instance = get_default_logger()
+    return logger_instance.capture_exception(exc_info, **kwargs)
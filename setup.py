@@ -37,6 +37,9 @@ setup(
     ],
     extras_require={
         'env': ['python-dotenv>=0.19.0,<2.0.0'],
+        'fast': ['orjson>=3.6.0'],
+        'async': ['aiohttp>=3.8.0'],
+        'compress': ['zstandard>=0.15.0'],
         'dev': [
             'pytest>=6.0.0',
             'pytest-cov>=2.0.0',
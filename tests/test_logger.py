@@ -3,6 +3,14 @@ Tests for HuntGlitch Python Logger
 """
 
 import os
+import sys
+import subprocess
+import gc
+import json
+import asyncio
+import threading
+import time
+from datetime import datetime
 import pytest
 from unittest.mock import Mock, patch
 
@@ -12,10 +20,36 @@ from huntglitch_python.logger import (
     capture_exception_and_report,
     ConfigurationError,
     APIError,
-    LOG_TYPES
+    LOG_TYPES,
+    flush,
+    get_default_logger,
+    set_default_logger,
+    reload_env,
+    _timestamp,
+    _queue
 )
 
 
+@pytest.fixture(autouse=True)
+def reset_module_state():
+    """Drop cached environment config and the default logger around each test."""
+    reload_env()
+    set_default_logger(None)
+    yield
+    reload_env()
+    set_default_logger(None)
+
+
+def _wait_for(condition, timeout=5.0):
+    """Poll until condition() is true or the timeout expires."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return condition()
+
+
 class TestHuntGlitchLogger:
     """Test cases for HuntGlitchLogger class."""
 
@@ -46,6 +80,15 @@ class TestHuntGlitchLogger:
         assert logger.project_key == 'env-project'
         assert logger.deliverable_key == 'env-deliverable'
 
+    def test_env_keys_cached_until_reload(self):
+        """Test that environment keys are read once and refreshed by reload_env."""
+        with patch.dict(os.environ, {'PROJECT_KEY': 'first', 'DELIVERABLE_KEY': 'env-deliverable'}):
+            assert HuntGlitchLogger(load_env=False).project_key == 'first'
+        with patch.dict(os.environ, {'PROJECT_KEY': 'second', 'DELIVERABLE_KEY': 'env-deliverable'}):
+            assert HuntGlitchLogger(load_env=False).project_key == 'first'
+            reload_env()
+            assert HuntGlitchLogger(load_env=False).project_key == 'second'
+
     def test_log_types_conversion(self):
         """Test log type string to int conversion."""
         logger = HuntGlitchLogger(
@@ -58,13 +101,91 @@ class TestHuntGlitchLogger:
         for log_type_str, expected_int in LOG_TYPES.items():
             payload = logger._prepare_payload({}, log_type_str)
             assert payload['o'] == expected_int
+            assert logger._prepare_payload({}, log_type_str.upper())['o'] == expected_int
+            assert logger._prepare_payload({}, expected_int)['o'] == expected_int
+
+        assert logger._prepare_payload({}, "Warning")['o'] == LOG_TYPES['warning']
+        assert logger._prepare_payload({}, "unknown")['o'] == LOG_TYPES['error']
+        assert logger._prepare_payload({}, True)['o'] is True
+        assert logger._prepare_payload({}, [4])['o'] == [4]
+
+    def test_encoded_payload_includes_project_keys(self):
+        """Test that the encoded body merges the static key prefix."""
+        logger = HuntGlitchLogger(
+            project_key=self.project_key,
+            deliverable_key=self.deliverable_key,
+            load_env=False
+        )
+
+        payload = logger._prepare_payload({"b": {}}, "warning", "127.0.0.1")
+        decoded = json.loads(logger._encode_payload(payload))
+
+        assert decoded["vp"] == self.project_key
+        assert decoded["vd"] == self.deliverable_key
+        assert decoded["o"] == LOG_TYPES["warning"]
+        assert decoded["r"] == "127.0.0.1"
 
-    @patch('huntglitch_python.logger.requests.post')
-    def test_successful_log_send(self, mock_post):
+    def test_error_value_is_bounded(self):
+        """Test that large error values are truncated."""
+        logger = HuntGlitchLogger(
+            project_key=self.project_key,
+            deliverable_key=self.deliverable_key,
+            load_env=False
+        )
+
+        text = logger._prepare_error_data("E", "x" * 5000, "test.py", 1)
+        exc = logger._prepare_error_data("E", ValueError("boom"), "test.py", 1)
+        items = logger._prepare_error_data("E", list(range(10)), "test.py", 1)
+
+        assert len(text["c"]) == 1000
+        assert exc["c"] == "boom"
+        assert items["c"] == str(list(range(10)))
+
+    def test_log_data_serialization(self):
+        """Test that additional data with non-JSON types is serialized."""
+        logger = HuntGlitchLogger(
+            project_key=self.project_key,
+            deliverable_key=self.deliverable_key,
+            load_env=False
+        )
+
+        log_data = {"i": {1: "int key", "when": datetime(2024, 1, 2, 3, 4, 5)}}
+        payload = logger._prepare_payload(log_data, "error")
+        decoded = json.loads(payload["a"])
+
+        assert decoded["i"]["1"] == "int key"
+        assert decoded["i"]["when"] == "2024-01-02 03:04:05"
+
+        big = logger._prepare_payload({"big": 2 ** 70}, "error")
+        assert json.loads(big["a"])["big"] == 2 ** 70
+
+    def test_prepared_request_reuses_template(self):
+        """Test that requests are built from a template prepared once."""
+        logger = HuntGlitchLogger(
+            project_key=self.project_key,
+            deliverable_key=self.deliverable_key,
+            load_env=False
+        )
+
+        first = logger._prepare_request(b'{"a":1}')
+        template = logger._request_template
+        second = logger._prepare_request(b'{"a":22}')
+
+        assert logger._request_template is template
+        assert first.method == "POST"
+        assert first.url == HuntGlitchLogger._url
+        assert first.headers["Content-Type"] == "application/json"
+        assert first.headers["Accept"] == "application/json"
+        assert first.headers["Content-Length"] == "7"
+        assert second.body == b'{"a":22}'
+        assert second.headers["Content-Length"] == "8"
+
+    @patch('requests.Session.send')
+    def test_successful_log_send(self, mock_send):
         """Test successful log sending."""
         mock_response = Mock()
         mock_response.raise_for_status.return_value = None
-        mock_post.return_value = mock_response
+        mock_send.return_value = mock_response
 
         logger = HuntGlitchLogger(
             project_key=self.project_key,
@@ -80,10 +201,10 @@ class TestHuntGlitchLogger:
         )
 
         assert result is True
-        assert mock_post.called
+        assert mock_send.called
 
-    @patch('huntglitch_python.logger.requests.post')
-    def test_retry_logic(self, mock_post):
+    @patch('requests.Session.send')
+    def test_retry_logic(self, mock_send):
         """Test retry logic on failed requests."""
         # Mock first call to fail, second to succeed
         mock_response_fail = Mock()
@@ -92,7 +213,7 @@ class TestHuntGlitchLogger:
         mock_response_success = Mock()
         mock_response_success.raise_for_status.return_value = None
 
-        mock_post.side_effect = [
+        mock_send.side_effect = [
             mock_response_fail,
             mock_response_success
         ]
@@ -113,12 +234,12 @@ class TestHuntGlitchLogger:
         )
 
         assert result is True
-        assert mock_post.call_count == 2
+        assert mock_send.call_count == 2
 
-    @patch('huntglitch_python.logger.requests.post')
-    def test_silent_failure_mode(self, mock_post):
+    @patch('requests.Session.send')
+    def test_silent_failure_mode(self, mock_send):
         """Test silent failure mode."""
-        mock_post.side_effect = Exception("Network error")
+        mock_send.side_effect = Exception("Network error")
 
         logger = HuntGlitchLogger(
             project_key=self.project_key,
@@ -137,10 +258,10 @@ class TestHuntGlitchLogger:
 
         assert result is False  # Should return False instead of raising
 
-    @patch('huntglitch_python.logger.requests.post')
-    def test_non_silent_failure_mode(self, mock_post):
+    @patch('requests.Session.send')
+    def test_non_silent_failure_mode(self, mock_send):
         """Test non-silent failure mode."""
-        mock_post.side_effect = Exception("Network error")
+        mock_send.side_effect = Exception("Network error")
 
         logger = HuntGlitchLogger(
             project_key=self.project_key,
@@ -170,12 +291,12 @@ class TestHuntGlitchLogger:
         result = logger.capture_exception()
         assert result is False
 
-    @patch('huntglitch_python.logger.requests.post')
-    def test_capture_exception_with_active_exception(self, mock_post):
+    @patch('requests.Session.send')
+    def test_capture_exception_with_active_exception(self, mock_send):
         """Test capturing active exception."""
         mock_response = Mock()
         mock_response.raise_for_status.return_value = None
-        mock_post.return_value = mock_response
+        mock_send.return_value = mock_response
 
         logger = HuntGlitchLogger(
             project_key=self.project_key,
@@ -191,17 +312,350 @@ class TestHuntGlitchLogger:
             )
             assert result is True
 
+    @patch('requests.Session.send')
+    def test_background_mode_delivers_from_worker(self, mock_send):
+        """Test that background mode queues logs for the worker thread."""
+        sent = threading.Event()
+        mock_response = Mock()
+        mock_response.raise_for_status.return_value = None
+
+        def fake_send(*args, **kwargs):
+            sent.set()
+            return mock_response
+
+        mock_send.side_effect = fake_send
+
+        logger = HuntGlitchLogger(
+            project_key=self.project_key,
+            deliverable_key=self.deliverable_key,
+            background=True,
+            load_env=False
+        )
+
+        result = logger.send_log(
+            error_name="TestError",
+            error_value="Test error message",
+            file_name="test.py",
+            line_number=42
+        )
+        flush()
+
+        assert result is True
+        assert sent.wait(timeout=5)
+
+    @patch('requests.Session.send')
+    def test_dedupe_suppresses_repeated_exception(self, mock_send):
+        """Test that identical exceptions within the TTL are sent once."""
+        mock_response = Mock()
+        mock_response.raise_for_status.return_value = None
+        mock_send.return_value = mock_response
+
+        logger = HuntGlitchLogger(
+            project_key=self.project_key,
+            deliverable_key=self.deliverable_key,
+            dedupe_ttl=60,
+            load_env=False
+        )
+
+        for _ in range(3):
+            try:
+                raise ValueError("Test exception")
+            except ValueError:
+                assert logger.capture_exception() is True
+
+        assert mock_send.call_count == 1
+
+    def test_loggers_share_default_session(self):
+        """Test that loggers reuse the pooled module session."""
+        first = HuntGlitchLogger(
+            project_key=self.project_key,
+            deliverable_key=self.deliverable_key,
+            load_env=False
+        )
+        second = HuntGlitchLogger(
+            project_key=self.project_key,
+            deliverable_key=self.deliverable_key,
+            load_env=False
+        )
+        assert first.session is second.session
+
+    def test_timestamp_format(self):
+        """Test that cached timestamps are valid ISO 8601 in UTC."""
+        first = _timestamp()
+        second = _timestamp()
+
+        parsed = datetime.strptime(second, "%Y-%m-%dT%H:%M:%S.%f")
+        assert abs((datetime.utcnow() - parsed).total_seconds()) < 5
+        assert second >= first
+
+    @patch('requests.Session.send')
+    def test_low_severity_logs_are_batched(self, mock_send):
+        """Test that warnings are buffered while errors are queued immediately."""
+        mock_response = Mock()
+        mock_response.raise_for_status.return_value = None
+        mock_send.return_value = mock_response
+
+        logger = HuntGlitchLogger(
+            project_key=self.project_key,
+            deliverable_key=self.deliverable_key,
+            batch_max=3,
+            flush_interval=60,
+            load_env=False
+        )
+        assert logger.background is True
+
+        for _ in range(2):
+            assert logger.send_log("Warn", "w", "test.py", 1, log_type="warning")
+        time.sleep(0.1)
+        assert mock_send.call_count == 0
+
+        assert logger.send_log("Err", "e", "test.py", 2, log_type="error")
+        assert _wait_for(lambda: mock_send.call_count == 3)
+
+    @patch('requests.Session.send')
+    def test_buffered_log_sent_after_flush_interval(self, mock_send):
+        """Test that a lone buffered log is sent by the worker once the interval expires."""
+        mock_response = Mock()
+        mock_response.raise_for_status.return_value = None
+        mock_send.return_value = mock_response
+
+        logger = HuntGlitchLogger(
+            project_key=self.project_key,
+            deliverable_key=self.deliverable_key,
+            batch_max=100,
+            flush_interval=0.2,
+            load_env=False
+        )
+
+        assert logger.send_log("Info", "i", "test.py", 3, log_type="info")
+        assert mock_send.call_count == 0
+        assert _wait_for(lambda: mock_send.call_count == 1)
+
+    @patch('requests.Session.send')
+    def test_buffered_logs_survive_logger_garbage_collection(self, mock_send):
+        """Test that logs buffered by a dropped logger are still flushed."""
+        mock_response = Mock()
+        mock_response.raise_for_status.return_value = None
+        mock_send.return_value = mock_response
+
+        logger = HuntGlitchLogger(
+            project_key=self.project_key,
+            deliverable_key=self.deliverable_key,
+            batch_max=10,
+            flush_interval=60,
+            load_env=False
+        )
+        assert logger.send_log("Warning", "w", "test.py", 1, log_type="warning")
+        del logger
+        gc.collect()
+
+        flush()
+        assert _wait_for(lambda: mock_send.call_count == 1)
+
+    @patch('requests.Session.send')
+    def test_exception_site_computed_once(self, mock_send):
+        """Test that reporting one exception twice reuses its cached site."""
+        mock_response = Mock()
+        mock_response.raise_for_status.return_value = None
+        mock_send.return_value = mock_response
+
+        logger = HuntGlitchLogger(
+            project_key=self.project_key,
+            deliverable_key=self.deliverable_key,
+            load_env=False
+        )
+
+        try:
+            raise ValueError("Test exception")
+        except ValueError as exc:
+            assert logger.capture_exception() is True
+            site = exc._huntglitch_site
+            assert site[0] == __file__
+            assert site[2] == "Test exception"
+            assert logger.capture_exception() is True
+            assert exc._huntglitch_site is site
+
+        assert mock_send.call_count == 2
+
+    @patch('requests.Session.send')
+    def test_capture_exception_with_explicit_exc_info(self, mock_send):
+        """Test reporting an exception captured earlier via exc_info."""
+        mock_response = Mock()
+        mock_response.raise_for_status.return_value = None
+        mock_send.return_value = mock_response
+
+        logger = HuntGlitchLogger(
+            project_key=self.project_key,
+            deliverable_key=self.deliverable_key,
+            load_env=False
+        )
+
+        try:
+            raise KeyError("stored")
+        except KeyError:
+            exc_info = sys.exc_info()
+
+        # No exception is active here; the stored tuple is reported instead
+        assert logger.capture_exception(exc_info=exc_info) is True
+        body = json.loads(mock_send.call_args[0][0].body)
+        assert json.loads(body["a"])["b"]["h"] == "KeyError"
+
+    @patch('requests.Session.send')
+    def test_capture_exception_without_traceback(self, mock_send):
+        """Test reporting an exception that was never raised."""
+        mock_response = Mock()
+        mock_response.raise_for_status.return_value = None
+        mock_send.return_value = mock_response
+
+        logger = HuntGlitchLogger(
+            project_key=self.project_key,
+            deliverable_key=self.deliverable_key,
+            load_env=False
+        )
+
+        error = ValueError("never raised")
+        assert logger.capture_exception(exc_info=(ValueError, error, None)) is True
+        error_data = json.loads(json.loads(mock_send.call_args[0][0].body)["a"])["b"]
+        assert error_data["h"] == "ValueError"
+        assert error_data["d"] == "unknown"
+        assert error_data["f"] == 0
+
+    def test_import_does_not_load_requests(self):
+        """Test that importing the package defers importing requests."""
+        code = (
+            "import sys, huntglitch_python; "
+            "huntglitch_python.HuntGlitchLogger(project_key='p', deliverable_key='d', load_env=False); "
+            "sys.exit('requests' in sys.modules)"
+        )
+        assert subprocess.run([sys.executable, "-c", code]).returncode == 0
+
+    def test_large_bodies_are_compressed(self):
+        """Test zstd compression of bodies above the threshold."""
+        zstandard = pytest.importorskip("zstandard")
+        logger = HuntGlitchLogger(
+            project_key=self.project_key,
+            deliverable_key=self.deliverable_key,
+            compress=True,
+            load_env=False
+        )
+
+        small = logger._prepare_request(b'{"a":1}')
+        large_body = json.dumps({"a": "x" * 5000}).encode()
+        large = logger._prepare_request(large_body)
+
+        assert "Content-Encoding" not in small.headers
+        assert large.headers["Content-Encoding"] == "zstd"
+        assert int(large.headers["Content-Length"]) < len(large_body)
+        assert zstandard.ZstdDecompressor().decompress(large.body) == large_body
+        assert "Content-Encoding" not in logger._request_template.headers
+
+    @patch('requests.Session.send')
+    def test_send_log_defaults_to_caller_location(self, mock_send):
+        """Test that file and line default to the caller of send_log."""
+        mock_response = Mock()
+        mock_response.raise_for_status.return_value = None
+        mock_send.return_value = mock_response
+
+        logger = HuntGlitchLogger(
+            project_key=self.project_key,
+            deliverable_key=self.deliverable_key,
+            load_env=False
+        )
+
+        expected_line = sys._getframe().f_lineno + 1
+        assert logger.send_log("CustomEvent", "Something happened") is True
+
+        body = json.loads(mock_send.call_args[0][0].body)
+        error_data = json.loads(body["a"])["b"]
+        assert error_data["d"] == __file__
+        assert error_data["f"] == expected_line
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_background_worker_restarts_after_fork(self):
+        """Test that a forked child starts its own worker and connection pool."""
+        logger = HuntGlitchLogger(
+            project_key=self.project_key,
+            deliverable_key=self.deliverable_key,
+            background=True,
+            load_env=False
+        )
+        parent_session = logger.session
+        logger._prepare_request(b"{}")
+
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover - runs in the child
+            code = 1
+            try:
+                if logger._request_template is not None or logger.session is parent_session:
+                    os._exit(2)
+                sent = threading.Event()
+                mock_response = Mock()
+                mock_response.raise_for_status.return_value = None
+
+                def fake_send(*args, **kwargs):
+                    sent.set()
+                    return mock_response
+
+                with patch('requests.Session.send', side_effect=fake_send):
+                    logger.send_log("TestError", "from child", "test.py", 1)
+                    code = 0 if sent.wait(timeout=5) else 1
+            finally:
+                os._exit(code)
+
+        _, status = os.waitpid(pid, 0)
+        assert os.WIFEXITED(status) and os.WEXITSTATUS(status) == 0
+
+    def test_background_queue_is_bounded(self):
+        """Test that logs are dropped instead of queued beyond the limit."""
+        logger = HuntGlitchLogger(
+            project_key=self.project_key,
+            deliverable_key=self.deliverable_key,
+            background=True,
+            load_env=False
+        )
+
+        with patch('huntglitch_python.logger.MAX_QUEUE_SIZE', 0):
+            assert logger.send_log("TestError", "dropped", "test.py", 1) is False
+
+    @patch('requests.Session.send')
+    def test_flush_with_timeout_stops_at_deadline(self, mock_send):
+        """Test that a timed flush tries each log once and gives up in time."""
+        import requests
+
+        def slow_failure(*args, **kwargs):
+            time.sleep(0.2)
+            raise requests.exceptions.ConnectionError("unreachable")
+
+        mock_send.side_effect = slow_failure
+
+        logger = HuntGlitchLogger(
+            project_key=self.project_key,
+            deliverable_key=self.deliverable_key,
+            retries=3,
+            load_env=False
+        )
+        for _ in range(5):
+            _queue.append((logger, b"{}"))
+
+        started = time.monotonic()
+        sent = flush(timeout=0.3)
+
+        assert time.monotonic() - started < 1
+        assert sent < 5
+        assert mock_send.call_count == sent  # No retries while draining
+        assert len(_queue) == 0
+
 
 class TestBackwardCompatibility:
     """Test backward compatibility functions."""
 
     @patch.dict(os.environ, {'PROJECT_KEY': 'test-project', 'DELIVERABLE_KEY': 'test-deliverable'})
-    @patch('huntglitch_python.logger.requests.post')
-    def test_send_huntglitch_log_function(self, mock_post):
+    @patch('requests.Session.send')
+    def test_send_huntglitch_log_function(self, mock_send):
         """Test the backward compatibility function."""
         mock_response = Mock()
         mock_response.raise_for_status.return_value = None
-        mock_post.return_value = mock_response
+        mock_send.return_value = mock_response
 
         result = send_huntglitch_log(
             error_name="TestError",
@@ -211,22 +665,150 @@ class TestBackwardCompatibility:
         )
 
         assert result is True
-        assert mock_post.called
+        assert mock_send.called
 
     @patch.dict(os.environ, {'PROJECT_KEY': 'test-project', 'DELIVERABLE_KEY': 'test-deliverable'})
-    @patch('huntglitch_python.logger.requests.post')
-    def test_capture_exception_and_report_function(self, mock_post):
+    @patch('requests.Session.send')
+    def test_capture_exception_and_report_function(self, mock_send):
         """Test the backward compatibility exception capture function."""
         mock_response = Mock()
         mock_response.raise_for_status.return_value = None
-        mock_post.return_value = mock_response
+        mock_send.return_value = mock_response
 
         try:
             raise RuntimeError("Test exception")
         except RuntimeError:
             result = capture_exception_and_report()
             assert result is True
-            assert mock_post.called
+            assert mock_send.called
+
+
+class TestDefaultLogger:
+    """Test the shared default logger accessors."""
+
+    @patch.dict(os.environ, {'PROJECT_KEY': 'test-project', 'DELIVERABLE_KEY': 'test-deliverable'})
+    def test_get_default_logger_is_shared(self):
+        """Test that the default logger is created once and reused."""
+        assert get_default_logger() is get_default_logger()
+
+    def test_set_default_logger(self):
+        """Test replacing the default logger."""
+        custom = HuntGlitchLogger(
+            project_key="custom-project",
+            deliverable_key="custom-deliverable",
+            load_env=False
+        )
+        set_default_logger(custom)
+        assert get_default_logger() is custom
+
+
+class _FakeAioResponse:
+    """Minimal async context manager standing in for an aiohttp response."""
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def raise_for_status(self):
+        return None
+
+
+class TestAsyncAPI:
+    """Test the aiohttp-based async API."""
+
+    def setup_method(self):
+        """Setup for each test method."""
+        pytest.importorskip("aiohttp")
+        self.logger = HuntGlitchLogger(
+            project_key="test-project-key",
+            deliverable_key="test-deliverable-key",
+            load_env=False
+        )
+
+    def test_acapture_exception(self):
+        """Test capturing an exception from async code."""
+        session = Mock()
+        session.post.return_value = _FakeAioResponse()
+
+        async def run():
+            try:
+                raise RuntimeError("Async operation failed")
+            except RuntimeError:
+                return await self.logger.acapture_exception(
+                    additional_data={"operation_type": "async"}
+                )
+
+        with patch.object(self.logger, "_get_aio_session", return_value=session):
+            result = asyncio.run(run())
+
+        assert result is True
+        body = session.post.call_args[1]["data"]
+        assert json.loads(body)["vp"] == "test-project-key"
+
+    def test_asend_log_location_from_scheduled_task(self):
+        """Test that a task-scheduled asend_log reports where it was called."""
+        session = Mock()
+        session.post.return_value = _FakeAioResponse()
+
+        async def run():
+            task = asyncio.create_task(self.logger.asend_log("AsyncEvent", "e"))
+            return await task
+
+        expected_line = run.__code__.co_firstlineno + 1
+        with patch.object(self.logger, "_get_aio_session", return_value=session):
+            assert asyncio.run(run()) is True
+
+        body = json.loads(session.post.call_args[1]["data"])
+        error_data = json.loads(body["a"])["b"]
+        assert error_data["d"] == __file__
+        assert error_data["f"] == expected_line
+
+    def test_aio_session_per_event_loop(self):
+        """Test that each event loop keeps its own aiohttp session."""
+        async def get_session():
+            session = self.logger._get_aio_session()
+            assert self.logger._get_aio_session() is session
+            return session
+
+        first = asyncio.run(get_session())
+        second = asyncio.run(get_session())
+
+        assert second is not first
+        assert not first.closed  # Never detached by the other loop
+        first.detach()  # Its loop is gone; silence the unclosed warning
+        second.detach()
+
+    def test_aclose_closes_sessions_of_all_loops(self):
+        """Test that aclose also closes sessions of loops in other threads."""
+        other_loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=other_loop.run_forever, daemon=True)
+        thread.start()
+
+        async def get_session():
+            return self.logger._get_aio_session()
+
+        try:
+            other = asyncio.run_coroutine_threadsafe(get_session(), other_loop).result(5)
+
+            async def run():
+                own = await get_session()
+                assert other_loop in self.logger._aio_sessions  # Left alone
+                await self.logger.aclose()
+                return own
+
+            own = asyncio.run(run())
+            assert own is not other
+            assert own.closed and other.closed
+        finally:
+            other_loop.call_soon_threadsafe(other_loop.stop)
+            thread.join(5)
+            other_loop.close()
+
+    def test_acapture_exception_no_active_exception(self):
+        """Test async capture when no exception is active."""
+        assert asyncio.run(self.logger.acapture_exception()) is False
 
 
 if __name__ == "__main__":